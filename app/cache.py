@@ -1,5 +1,7 @@
-import json
-from typing import Any, Optional
+from datetime import datetime
+from hashlib import blake2b
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import msgspec
 import redis.asyncio as redis
 
 from .config import get_settings
@@ -8,27 +10,122 @@ from .schemas import Note
 settings = get_settings()
 
 
-def _note_cache_key(note_id: int) -> str:
-    return f"note:{note_id}"
+class NoteMsg(msgspec.Struct):
+    id: int
+    title: str
+    content: str
+    tags: Optional[List[str]]
+    created_at: datetime
+    updated_at: datetime
+    is_deleted: bool
+    deleted_at: Optional[datetime]
+
+
+_enc = msgspec.msgpack.Encoder()
+_dec = msgspec.msgpack.Decoder(NoteMsg)
+
+# keys are built as bytes so redis-py sends them without a format/encode step.
+_NOTE_PREFIX = b"note:"
+
+# bumped on every write so all cached list pages are invalidated at once.
+_LIST_GENERATION_KEY = "list:gen"
+
+
+def _note_cache_key(note_id: int) -> bytes:
+    return _NOTE_PREFIX + str(note_id).encode("ascii")
+
+
+def _to_msg(note: Note) -> NoteMsg:
+    return NoteMsg(
+        id=note.id,
+        title=note.title,
+        content=note.content,
+        tags=note.tags,
+        created_at=note.created_at,
+        updated_at=note.updated_at,
+        is_deleted=note.is_deleted,
+        deleted_at=note.deleted_at,
+    )
+
+
+def _from_msg(msg: NoteMsg) -> Note:
+    # the payload was validated before it was cached, so skip re-validation.
+    return Note.model_construct(**msgspec.structs.asdict(msg))
+
+
+def _encode_note(note: Note) -> bytes:
+    return _enc.encode(_to_msg(note))
+
+
+def _decode_note(data: bytes) -> Optional[Note]:
+    try:
+        msg = _dec.decode(data)
+    except msgspec.DecodeError:
+        # entries written in an older format are treated as a cache miss.
+        return None
+    return _from_msg(msg)
 
 
 async def get_cached_note(client: redis.Redis, note_id: int) -> Optional[Note]:
     data = await client.get(_note_cache_key(note_id))
     if not data:
         return None
-    payload: dict[str, Any] = json.loads(data)
-    return Note(**payload)
+    return _decode_note(data)
+
+
+async def get_cached_notes_many(client: redis.Redis, note_ids: Sequence[int]) -> Dict[int, Note]:
+    if not note_ids:
+        return {}
+    values = await client.mget([_note_cache_key(note_id) for note_id in note_ids])
+    cached: Dict[int, Note] = {}
+    for note_id, data in zip(note_ids, values):
+        if not data:
+            continue
+        note = _decode_note(data)
+        if note:
+            cached[note_id] = note
+    return cached
 
 
 async def cache_note(client: redis.Redis, note: Note) -> None:
     await client.set(
         _note_cache_key(note.id),
-        note.model_dump_json(),
+        _encode_note(note),
         ex=settings.note_cache_ttl_seconds,
     )
 
 
+async def cache_notes_many(client: redis.Redis, notes: Sequence[Note]) -> None:
+    if not notes:
+        return
+    async with client.pipeline(transaction=False) as pipe:
+        for note in notes:
+            pipe.set(
+                _note_cache_key(note.id),
+                _encode_note(note),
+                ex=settings.note_cache_ttl_seconds,
+            )
+        await pipe.execute()
+
+
 async def invalidate_note_cache(client: redis.Redis, note_id: int) -> None:
     await client.delete(_note_cache_key(note_id))
 
 
+async def notes_list_cache_key(client: redis.Redis, params: Mapping[str, Any]) -> str:
+    generation = await client.get(_LIST_GENERATION_KEY) or b"0"
+    digest = blake2b(repr(sorted(params.items())).encode(), digest_size=16).hexdigest()
+    return f"list:{int(generation)}:{digest}"
+
+
+async def get_cached_notes_list(client: redis.Redis, key: str) -> Optional[bytes]:
+    return await client.get(key)
+
+
+async def cache_notes_list(client: redis.Redis, key: str, body: bytes) -> None:
+    # pages are cached as the rendered JSON body so hits are returned without decoding.
+    await client.set(key, body, ex=settings.list_cache_ttl_seconds)
+
+
+async def invalidate_notes_list_cache(client: redis.Redis) -> None:
+    await client.incr(_LIST_GENERATION_KEY)
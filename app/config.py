@@ -9,11 +9,15 @@ class Settings(BaseSettings):
         populate_by_name=True,
     )
     
-    database_url: str = Field(default="sqlite:///./notes.db", alias="DATABASE_URL")
+    database_url: str = Field(default="sqlite+aiosqlite:///./notes.db", alias="DATABASE_URL")
+    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=40, alias="DB_MAX_OVERFLOW")
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
+    redis_max_connections: int = Field(default=128, alias="REDIS_MAX_CONNECTIONS")
     rate_limit: int = Field(default=100, alias="RATE_LIMIT")
     rate_limit_window_seconds: int = Field(default=600, alias="RATE_LIMIT_WINDOW")
     note_cache_ttl_seconds: int = Field(default=300, alias="NOTE_CACHE_TTL")
+    list_cache_ttl_seconds: int = Field(default=30, alias="LIST_CACHE_TTL")
     recent_notes_limit: int = Field(default=5, alias="RECENT_NOTES_LIMIT")
 
 
@@ -1,54 +1,154 @@
+import base64
+import binascii
 import datetime as dt
-from typing import Optional, Sequence
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from typing import Dict, Optional, Sequence, Tuple
+from sqlalchemy import RowMapping, Select, bindparam, cast, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import models, schemas
 
+# upper bound of the 32-bit Integer primary key.
+_MAX_NOTE_ID = 2**31 - 1
 
-def create_note(db: Session, note_in: schemas.NoteCreate) -> models.Note:
+# plain column selects skip ORM identity-map bookkeeping on read-only list queries.
+_NOTE_COLUMNS = (
+    models.Note.id,
+    models.Note.title,
+    models.Note.content,
+    models.Note.tags,
+    models.Note.created_at,
+    models.Note.updated_at,
+    models.Note.is_deleted,
+    models.Note.deleted_at,
+)
+
+
+async def create_note(db: AsyncSession, note_in: schemas.NoteCreate) -> models.Note:
     note = models.Note(
         title=note_in.title,
         content=note_in.content,
         tags=note_in.tags or [],
     )
     db.add(note)
-    db.commit()
-    db.refresh(note)
+    await db.commit()
     return note
 
 
-def get_note(db: Session, note_id: int, include_deleted: bool = False) -> Optional[models.Note]:
+async def get_note(db: AsyncSession, note_id: int, include_deleted: bool = False) -> Optional[models.Note]:
     stmt = select(models.Note).where(models.Note.id == note_id)
     if not include_deleted:
         stmt = stmt.where(models.Note.is_deleted.is_(False))
-    return db.scalar(stmt)
+    return await db.scalar(stmt)
 
 
-def list_notes(
-    db: Session,
+async def get_notes_by_ids(db: AsyncSession, note_ids: Sequence[int]) -> Dict[int, models.Note]:
+    if not note_ids:
+        return {}
+    stmt = select(models.Note).where(
+        models.Note.id.in_(note_ids),
+        models.Note.is_deleted.is_(False),
+    )
+    return {note.id: note for note in await db.scalars(stmt)}
+
+
+async def list_notes(
+    db: AsyncSession,
     *,
     tag: Optional[str] = None,
     title_contains: Optional[str] = None,
     include_deleted: bool = False,
-) -> Sequence[models.Note]:
-    stmt = select(models.Note)
+    limit: int = 50,
+    cursor: Optional[Tuple[dt.datetime, int]] = None,
+) -> Tuple[Sequence[RowMapping], Optional[str]]:
+    stmt = _filter_notes(
+        db,
+        select(*_NOTE_COLUMNS),
+        tag=tag,
+        title_contains=title_contains,
+        include_deleted=include_deleted,
+    )
+    if cursor:
+        cursor_created_at, cursor_id = cursor
+        stmt = stmt.where(tuple_(models.Note.created_at, models.Note.id) < (cursor_created_at, cursor_id))
+    # fetch one extra row to know whether another page follows.
+    stmt = stmt.order_by(models.Note.created_at.desc(), models.Note.id.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return rows, next_cursor
+
+
+async def count_notes(
+    db: AsyncSession,
+    *,
+    tag: Optional[str] = None,
+    title_contains: Optional[str] = None,
+    include_deleted: bool = False,
+) -> int:
+    stmt = _filter_notes(
+        db,
+        select(func.count()).select_from(models.Note),
+        tag=tag,
+        title_contains=title_contains,
+        include_deleted=include_deleted,
+    )
+    return await db.scalar(stmt)
+
+
+def _filter_notes(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    tag: Optional[str],
+    title_contains: Optional[str],
+    include_deleted: bool,
+) -> Select:
     if not include_deleted:
         stmt = stmt.where(models.Note.is_deleted.is_(False))
     if title_contains:
-        stmt = stmt.where(models.Note.title.ilike(f"%{title_contains}%"))
-    stmt = stmt.order_by(models.Note.created_at.desc())
-    results = db.execute(stmt).scalars().all()
+        # a named bind keeps the SQL text identical across searches so prepared statements are reused.
+        stmt = stmt.where(models.Note.title.ilike(bindparam("title_pattern", f"%{title_contains}%")))
     if tag:
-        results = [note for note in results if note.tags and tag in note.tags]
-    return results
+        stmt = stmt.where(_has_tag(db, tag))
+    return stmt
 
 
-def soft_delete_note(db: Session, note: models.Note) -> models.Note:
-    note.is_deleted = True
-    note.deleted_at = dt.datetime.utcnow()
-    db.add(note)
-    db.commit()
-    db.refresh(note)
-    return note
+def _encode_cursor(created_at: dt.datetime, note_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{note_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
 
+def decode_cursor(cursor: str) -> Tuple[dt.datetime, int]:
+    try:
+        created_at, note_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        created_at, note_id = dt.datetime.fromisoformat(created_at), int(note_id)
+    except (ValueError, binascii.Error) as exc:
+        raise ValueError("Invalid cursor") from exc
+    # ids outside the Integer column range would only fail later, inside the driver.
+    if not 0 < note_id <= _MAX_NOTE_ID:
+        raise ValueError("Invalid cursor")
+    return created_at, note_id
+
+
+def _has_tag(db: AsyncSession, tag: str):
+    if db.get_bind().dialect.name == "postgresql":
+        # JSONB containment, served by the GIN index on tags.
+        return models.Note.tags.op("@>")(cast([tag], JSONB))
+    tag_values = func.json_each(models.Note.tags).table_valued("value")
+    return select(literal(1)).select_from(tag_values).where(tag_values.c.value == tag).exists()
+
+
+async def soft_delete_note(db: AsyncSession, note_id: int) -> Optional[models.Note]:
+    # the is_deleted predicate makes "already deleted" a no-op, so no prior SELECT is needed.
+    stmt = (
+        update(models.Note)
+        .where(models.Note.id == note_id, models.Note.is_deleted.is_(False))
+        .values(is_deleted=True, deleted_at=models.db_now())
+        .returning(models.Note)
+    )
+    note = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
+    return note
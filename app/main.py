@@ -1,31 +1,60 @@
-from typing import List, Optional
-from fastapi import Depends, FastAPI, HTTPException, Query, status, Request
-from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Sequence
+from fastapi import Depends, FastAPI, HTTPException, Query, status, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 import redis.asyncio as redis
 
 from . import crud, models, schemas
-from .cache import cache_note, get_cached_note, invalidate_note_cache
+from .cache import (
+    cache_note,
+    cache_notes_list,
+    cache_notes_many,
+    get_cached_note,
+    get_cached_notes_list,
+    get_cached_notes_many,
+    invalidate_note_cache,
+    invalidate_notes_list_cache,
+    notes_list_cache_key,
+)
 from .config import get_settings
 from .database import Base, engine, get_db
 from .rate_limit import rate_limiter
 from .recent import get_recent_notes, push_recent_note
-from .redis_client import redis_dependency
+from .redis_client import close_redis, redis_dependency
 
 settings = get_settings()
-app = FastAPI(title="Notes API", version="1.0.0")
 
-Base.metadata.create_all(bind=engine)
+
+class UTCJSONResponse(ORJSONResponse):
+    # render UTC datetimes with a "Z" suffix, matching Pydantic's output on the other endpoints.
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await close_redis()
+    await engine.dispose()
+
+
+app = FastAPI(title="Notes API", version="1.0.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.post("/notes", response_model=schemas.Note, status_code=status.HTTP_201_CREATED, dependencies=[Depends(rate_limiter)])
 async def create_note(
     note_in: schemas.NoteCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     cache_client: redis.Redis = Depends(redis_dependency),
 ) -> schemas.Note:
-    note = crud.create_note(db, note_in)
+    note = await crud.create_note(db, note_in)
     note_schema = schemas.Note.model_validate(note)
     await _safe_cache_note(cache_client, note_schema)
+    await _safe_invalidate_list_cache(cache_client)
     return note_schema
 
 
@@ -34,33 +63,62 @@ async def list_notes(
     tag: Optional[str] = Query(default=None),
     title_contains: Optional[str] = Query(default=None),
     include_deleted: bool = Query(default=False),
-    db: Session = Depends(get_db),
-) -> schemas.NotesListResponse:
-    notes = crud.list_notes(db, tag=tag, title_contains=title_contains, include_deleted=include_deleted)
-    items = [schemas.Note.model_validate(note) for note in notes]
-    return schemas.NotesListResponse(total=len(items), items=items)
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None),
+    count: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    cache_client: redis.Redis = Depends(redis_dependency),
+) -> Response:
+    try:
+        after = crud.decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    filters = {"tag": tag, "title_contains": title_contains, "include_deleted": include_deleted}
+    cache_key = await _safe_notes_list_cache_key(
+        cache_client,
+        {**filters, "limit": limit, "cursor": cursor, "count": count},
+    )
+    if cache_key:
+        cached = await _safe_get_cached_notes_list(cache_client, cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
+    rows, next_cursor = await crud.list_notes(db, **filters, limit=limit, cursor=after)
+    total = await crud.count_notes(db, **filters) if count else None
+    # rows are trusted DB output, so encode them directly instead of round-tripping through
+    # NotesListResponse; response_model is kept for the OpenAPI schema.
+    response = UTCJSONResponse({"total": total, "next_cursor": next_cursor, "items": [dict(row) for row in rows]})
+    if cache_key:
+        await _safe_cache_notes_list(cache_client, cache_key, response.body)
+    return response
 
 
 @app.get("/notes/recent", response_model=List[schemas.Note], dependencies=[Depends(rate_limiter)])
 async def recent_notes(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     cache_client: redis.Redis = Depends(redis_dependency),
 ) -> List[schemas.Note]:
     note_ids = await _safe_get_recent(cache_client, request)
-    items: List[schemas.Note] = []
-    for note_id in note_ids:
-        note = crud.get_note(db, note_id, include_deleted=False)
-        if note:
-            items.append(schemas.Note.model_validate(note))
-    return items
+    cached = await _safe_get_cached_notes_many(cache_client, note_ids)
+    # read_note also caches notes fetched with include_deleted=true; never surface those here.
+    found = {note_id: note for note_id, note in cached.items() if not note.is_deleted}
+    missing_ids = [note_id for note_id in note_ids if note_id not in found]
+    fetched = schemas.NoteListAdapter.validate_python(
+        list((await crud.get_notes_by_ids(db, missing_ids)).values()),
+        from_attributes=True,
+    )
+    await _safe_cache_notes_many(cache_client, fetched)
+    found.update((note.id, note) for note in fetched)
+    return [found[note_id] for note_id in note_ids if note_id in found]
 
 
 @app.get("/notes/{note_id}", response_model=schemas.Note, dependencies=[Depends(rate_limiter)])
 async def read_note(
     note_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     cache_client: redis.Redis = Depends(redis_dependency),
     use_cache: bool = Query(default=True),
     include_deleted: bool = Query(default=False),
@@ -71,7 +129,7 @@ async def read_note(
             await _safe_push_recent(cache_client, request, note_id)
             return note_schema
 
-    note = crud.get_note(db, note_id, include_deleted=include_deleted)
+    note = await crud.get_note(db, note_id, include_deleted=include_deleted)
     if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
 
@@ -84,16 +142,16 @@ async def read_note(
 @app.delete("/notes/{note_id}", response_model=schemas.Note, dependencies=[Depends(rate_limiter)])
 async def delete_note(
     note_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     cache_client: redis.Redis = Depends(redis_dependency),
 ) -> schemas.Note:
-    note = crud.get_note(db, note_id, include_deleted=True)
-    if not note or note.is_deleted:
+    note = await crud.soft_delete_note(db, note_id)
+    if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
 
-    note = crud.soft_delete_note(db, note)
     note_schema = schemas.Note.model_validate(note)
     await _safe_invalidate_cache(cache_client, note_id)
+    await _safe_invalidate_list_cache(cache_client)
     return note_schema
 
 
@@ -106,6 +164,15 @@ async def _safe_cache_note(client: redis.Redis, note: schemas.Note) -> None:
         pass
 
 
+async def _safe_cache_notes_many(client: redis.Redis, notes: Sequence[schemas.Note]) -> None:
+    if not client:
+        return
+    try:
+        await cache_notes_many(client, notes)
+    except redis.RedisError:
+        pass
+
+
 async def _safe_get_cached_note(client: redis.Redis, note_id: int) -> Optional[schemas.Note]:
     if not client:
         return None
@@ -115,6 +182,15 @@ async def _safe_get_cached_note(client: redis.Redis, note_id: int) -> Optional[s
         return None
 
 
+async def _safe_get_cached_notes_many(client: redis.Redis, note_ids: Sequence[int]) -> Dict[int, schemas.Note]:
+    if not client:
+        return {}
+    try:
+        return await get_cached_notes_many(client, note_ids)
+    except redis.RedisError:
+        return {}
+
+
 async def _safe_invalidate_cache(client: redis.Redis, note_id: int) -> None:
     if not client:
         return
@@ -124,6 +200,38 @@ async def _safe_invalidate_cache(client: redis.Redis, note_id: int) -> None:
         pass
 
 
+async def _safe_notes_list_cache_key(client: redis.Redis, params: Dict[str, object]) -> Optional[str]:
+    if not client:
+        return None
+    try:
+        return await notes_list_cache_key(client, params)
+    except redis.RedisError:
+        return None
+
+
+async def _safe_get_cached_notes_list(client: redis.Redis, key: str) -> Optional[bytes]:
+    try:
+        return await get_cached_notes_list(client, key)
+    except redis.RedisError:
+        return None
+
+
+async def _safe_cache_notes_list(client: redis.Redis, key: str, body: bytes) -> None:
+    try:
+        await cache_notes_list(client, key, body)
+    except redis.RedisError:
+        pass
+
+
+async def _safe_invalidate_list_cache(client: redis.Redis) -> None:
+    if not client:
+        return
+    try:
+        await invalidate_notes_list_cache(client)
+    except redis.RedisError:
+        pass
+
+
 async def _safe_push_recent(client: redis.Redis, request: Request, note_id: int) -> None:
     if not client:
         return
@@ -1,7 +1,8 @@
-import datetime as dt
-from sqlalchemy import Column, DateTime, Integer, String, Text, Boolean
+from sqlalchemy import Column, DDL, DateTime, Index, Integer, String, Text, Boolean, event
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.types import JSON
 
 from .database import Base
@@ -10,6 +11,25 @@ from .database import Base
 JsonType = JSON().with_variant(SQLiteJSON(), "sqlite").with_variant(JSONB(), "postgresql")
 
 
+class db_now(FunctionElement):
+    """Database-side current timestamp with microsecond precision on every dialect."""
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(db_now)
+def _compile_db_now(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(db_now, "sqlite")
+def _compile_db_now_sqlite(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP drops fractional seconds; pad %f to the YYYY-MM-DD HH:MM:SS.ffffff
+    # text SQLAlchemy writes for bound datetimes so keyset cursors compare consistently.
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+
+
 class Note(Base):
     __tablename__ = "notes"
 
@@ -17,9 +37,46 @@ class Note(Base):
     title = Column(String(100), nullable=False)
     content = Column(Text, nullable=False)
     tags = Column(JsonType, nullable=True, default=list)
-    created_at = Column(DateTime, default=dt.datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=dt.datetime.utcnow, onupdate=dt.datetime.utcnow, nullable=False)
+    # default= renders now() inside the INSERT, so tables created before server_default existed still work.
+    created_at = Column(DateTime(timezone=True), default=db_now(), server_default=db_now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=db_now(),
+        server_default=db_now(),
+        onupdate=db_now(),
+        nullable=False,
+    )
     is_deleted = Column(Boolean, default=False, nullable=False)
-    deleted_at = Column(DateTime, nullable=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    # fetch server-generated timestamps via RETURNING on INSERT instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        Index("ix_notes_tags_gin", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_notes_created_at", created_at.desc(), id.desc()),
+        # partial index over live notes, the default list query.
+        Index(
+            "ix_notes_live_created",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=is_deleted.is_(False),
+            sqlite_where=is_deleted.is_(False),
+        ),
+        Index(
+            "ix_notes_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# the trigram index backing title ilike searches needs pg_trgm.
+event.listen(
+    Note.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
 
 
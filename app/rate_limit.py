@@ -1,31 +1,50 @@
 from fastapi import HTTPException, status, Request, Depends
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
 from .config import get_settings
 from .redis_client import redis_dependency
 
 settings = get_settings()
 
+_RATE_PREFIX = b"rate:ip:"
 
-def _rate_limit_key(ip: str) -> str:
-    return f"rate:ip:{ip}"
+# INCR and start the window in one round trip; the TTL is only set when the key is created.
+_RATE_LIMIT_LUA = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return current
+"""
+_rate_limit_script: AsyncScript | None = None
+
+
+def _rate_limit_key(ip: str) -> bytes:
+    return _RATE_PREFIX + ip.encode("ascii")
 
 
 async def rate_limiter(
     request: Request,
     client: redis.Redis = Depends(redis_dependency),
 ) -> None:
+    global _rate_limit_script
     client_ip = request.client.host if request.client else "unknown"
     key = _rate_limit_key(client_ip)
 
-    async with client.pipeline() as pipe:
-        try:
-            pipe.incr(key, 1)
-            pipe.expire(key, settings.rate_limit_window_seconds, nx=True)
-            current_count, _ = await pipe.execute()
-        except redis.RedisError:
-            # if Redis fails, skip throttling to favor availability.
-            return
+    if _rate_limit_script is None:
+        _rate_limit_script = client.register_script(_RATE_LIMIT_LUA)
+
+    try:
+        # EVALSHA, reloading the script if the server reports NOSCRIPT.
+        current_count = await _rate_limit_script(
+            keys=[key],
+            args=[settings.rate_limit_window_seconds * 1000],
+            client=client,
+        )
+    except redis.RedisError:
+        # if Redis fails, skip throttling to favor availability.
+        return
 
     if current_count and int(current_count) > settings.rate_limit:
         raise HTTPException(
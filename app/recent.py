@@ -1,23 +1,37 @@
 from typing import List
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
 from .config import get_settings
 
 settings = get_settings()
 
+_RECENT_PREFIX = b"recent:ip:"
 
-def _recent_key(ip: str) -> str:
-    return f"recent:ip:{ip}"
+# move the note to the head of the list, trim it and refresh its TTL as one server-side command.
+_PUSH_RECENT_LUA = """
+redis.call('LREM', KEYS[1], 0, ARGV[1])
+redis.call('LPUSH', KEYS[1], ARGV[1])
+redis.call('LTRIM', KEYS[1], 0, ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+"""
+_push_recent_script: AsyncScript | None = None
+
+
+def _recent_key(ip: str) -> bytes:
+    return _RECENT_PREFIX + ip.encode("ascii")
 
 
 async def push_recent_note(client: redis.Redis, ip: str, note_id: int) -> None:
-    key = _recent_key(ip)
-    async with client.pipeline() as pipe:
-        pipe.lrem(key, 0, note_id)
-        pipe.lpush(key, note_id)
-        pipe.ltrim(key, 0, settings.recent_notes_limit - 1)
-        pipe.expire(key, settings.rate_limit_window_seconds)
-        await pipe.execute()
+    global _push_recent_script
+    if _push_recent_script is None:
+        _push_recent_script = client.register_script(_PUSH_RECENT_LUA)
+
+    await _push_recent_script(
+        keys=[_recent_key(ip)],
+        args=[note_id, settings.recent_notes_limit - 1, settings.rate_limit_window_seconds],
+        client=client,
+    )
 
 
 async def get_recent_notes(client: redis.Redis, ip: str) -> List[int]:
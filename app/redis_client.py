@@ -1,25 +1,21 @@
-import asyncio
-from typing import AsyncGenerator
 import redis.asyncio as redis
 
 from .config import get_settings
 
 settings = get_settings()
-_redis_instance: redis.Redis | None = None
-_lock = asyncio.Lock()
 
+# the pool opens sockets lazily, so building it at import time is cheap and avoids
+# any per-request initialisation; handlers wait for a free connection once it is exhausted.
+_pool = redis.BlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+)
+_client = redis.Redis(connection_pool=_pool)
 
-async def get_redis() -> redis.Redis:
-    global _redis_instance
-    if _redis_instance is None:
-        async with _lock:
-            if _redis_instance is None:
-                _redis_instance = redis.from_url(settings.redis_url)
-    return _redis_instance
 
-
-async def redis_dependency() -> AsyncGenerator[redis.Redis, None]:
-    client = await get_redis()
-    yield client
+async def close_redis() -> None:
+    await _client.aclose(close_connection_pool=True)
 
 
+async def redis_dependency() -> redis.Redis:
+    return _client
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter, validator
 
 
 class NoteBase(BaseModel):
@@ -39,8 +39,12 @@ class Note(NoteBase):
         from_attributes = True
 
 
+NoteListAdapter = TypeAdapter(List[Note])
+
+
 class NotesListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
     items: List[Note]
 
 